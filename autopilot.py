@@ -0,0 +1,89 @@
+import math
+import time
+
+# environment must come first so pygame starts headless
+from environment import AsteroidsEnv
+from entities import Asteroid, Player
+from utils.constants import ACTION_LEFT, ACTION_RIGHT, ACTION_SHOOT
+
+
+class Autopilot:
+    """Baseline scripted pilot.
+
+    Turns toward where the nearest asteroid will be when a bullet reaches it
+    and fires once the ship is lined up. It never thrusts, so the ship stays
+    where it spawned.
+    """
+
+    def __init__(self, aim_tolerance: float = 6, bullet_speed: float = 10) -> None:
+        self.aim_tolerance = aim_tolerance
+        self.bullet_speed = bullet_speed
+
+    def act(self, player: Player, asteroids: list[Asteroid]) -> int:
+        """Return an action bitmask for the current state."""
+        targets = [asteroid for asteroid in asteroids if not asteroid.exploded]
+        if not targets:
+            return 0
+
+        # Bullets leave from the center of the ship
+        origin_x = player.x + player.width // 2
+        origin_y = player.y + player.height // 2
+
+        target = min(
+            targets,
+            key=lambda asteroid: (asteroid.x - origin_x) ** 2
+            + (asteroid.y - origin_y) ** 2,
+        )
+        target_x, target_y = self.lead(target, origin_x, origin_y)
+
+        # Bullets travel at player.direction + 90 degrees, y pointing up
+        bullet_angle = math.degrees(math.atan2(origin_y - target_y, target_x - origin_x))
+        error = (bullet_angle - 90 - player.direction + 180) % 360 - 180
+
+        if error > self.aim_tolerance:
+            return ACTION_LEFT
+        if error < -self.aim_tolerance:
+            return ACTION_RIGHT
+        return ACTION_SHOOT
+
+    def lead(self, asteroid: Asteroid, origin_x: float, origin_y: float):
+        """Predict the asteroid's center when a bullet fired now would reach it."""
+        velocity_x = asteroid.speed * math.cos(asteroid.direction)
+        velocity_y = -asteroid.speed * math.sin(asteroid.direction)
+        center_x = asteroid.x + asteroid.width / 2
+        center_y = asteroid.y + asteroid.height / 2
+
+        target_x, target_y = center_x, center_y
+        for _ in range(3):
+            distance = math.hypot(target_x - origin_x, target_y - origin_y)
+            travel_time = distance / self.bullet_speed
+            target_x = center_x + velocity_x * travel_time
+            target_y = center_y + velocity_y * travel_time
+
+        return target_x, target_y
+
+
+def evaluate(episodes: int = 10, max_steps: int = 10_000, seed=0) -> None:
+    """Run the autopilot for a few episodes and print scores and throughput."""
+    env = AsteroidsEnv(max_steps, seed)
+    pilot = Autopilot()
+
+    total_steps = 0
+    start = time.perf_counter()
+    for episode in range(episodes):
+        env.reset()
+        done = False
+        while not done:
+            action = pilot.act(env.player, env.asteroids_manager.get_asteroids())
+            _, terminated, truncated = env.advance(action)
+            done = terminated or truncated
+
+        total_steps += env.steps
+        print(f"Episode {episode}: score={env.score} steps={env.steps}")
+
+    elapsed = time.perf_counter() - start
+    print(f"{total_steps / elapsed:.0f} steps/s")
+
+
+if __name__ == "__main__":
+    evaluate()
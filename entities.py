@@ -1,14 +1,80 @@
 import math
+import os
 import random
+import struct
 import pygame
 
 from utils.constants import (
+    ACTION_LEFT,
+    ACTION_RIGHT,
+    ACTION_SHOOT,
+    ACTION_THRUST,
     EXPLOSION_SOUND,
-    ASTEROID_SCORE_UP_EVENT,
+    EXPLOSION_SPRITE,
     SHOOT_SOUND,
     WINDOW_HEIGHT,
     WINDOW_WIDTH,
 )
+from utils.assets import assets
+from utils.events import ASTEROID_SPLIT, PLAYER_DAMAGED, SCORE_UP, EventBus
+from utils.telemetry import metrics
+
+# Binary layouts used by the snapshot()/restore() methods
+COUNT_STATE = struct.Struct("<I")
+# x, y, direction, lifetime, width, height
+BULLET_STATE = struct.Struct("<dddiHH")
+# x, y, direction, momentum x/y, lives, shoot cooldown, invincibility timer,
+# blink timer, is invincible, blink visible
+PLAYER_STATE = struct.Struct("<5d4i??")
+# x, y, direction (radians), speed, width, height, explosion timer, exploded, type
+ASTEROID_STATE = struct.Struct("<4dHHi?B")
+# random.Random internal state: version, 625 words, has gauss_next, gauss_next
+RNG_STATE = struct.Struct("<i625I?d")
+
+ASTEROID_TYPES = ("normal", "small")
+ASTEROID_SPRITES = {
+    "normal": "./assets/asteroid1.png",
+    "small": "./assets/asteroid2.png",
+}
+BULLET_SPRITE = "./assets/bullet_player.png"
+
+# Telemetry
+BULLETS_FIRED = metrics.counter("bullets_fired")
+BULLETS_EXPIRED = metrics.counter("bullets_expired")
+ASTEROIDS_SPAWNED = metrics.counter("asteroids_spawned")
+ASTEROIDS_DESTROYED = metrics.counter("asteroids_destroyed")
+COLLISIONS_TESTED = metrics.counter("collisions_tested")
+COLLISIONS_HIT = metrics.counter("collisions_hit")
+
+
+def read_count(data: bytes, record: struct.Struct) -> int:
+    """Read a record count and check `data` holds exactly that many records."""
+    if len(data) < COUNT_STATE.size:
+        raise ValueError("Snapshot section is too short for its record count.")
+
+    (count,) = COUNT_STATE.unpack_from(data)
+    if len(data) != COUNT_STATE.size + count * record.size:
+        raise ValueError(
+            f"Snapshot section holds {len(data)} bytes, expected {count} records."
+        )
+    return count
+
+
+def rotated_hitbox(x, y, width: int, height: int, angle) -> pygame.Rect:
+    """The rect pygame.transform.rotate gives a sprite, centered on the entity.
+
+    Computed from the angle alone so collisions do not depend on drawing.
+    """
+    if angle % 90 == 0:
+        size = (height, width) if angle % 180 else (width, height)
+    else:
+        angle_rad = math.radians(angle)
+        cos, sin = abs(math.cos(angle_rad)), abs(math.sin(angle_rad))
+        size = (int(width * cos + height * sin), int(width * sin + height * cos))
+
+    hitbox = pygame.Rect((0, 0), size)
+    hitbox.center = (x + width // 2, y + height // 2)
+    return hitbox
 
 
 class Entity:
@@ -17,7 +83,7 @@ class Entity:
         self.y = y
         self.width = width
         self.height = height
-        self.sprite = sprite
+        self.sprite = os.path.normpath(sprite)  # the asset manager's key
         self.collision_rect = pygame.Rect(x, y, width, height)
         self.debug_mode = False  # Flag for debug mode
 
@@ -53,35 +119,35 @@ class Bullet(Entity):
         height: int,
         sprite: str,
         direction: int = 0,
+        debug_mode: bool = False,
     ) -> None:
         super().__init__(x, y, width, height, sprite)
         self.direction = direction
         self.speed = 10
         self.lifetime = 100
-        self.debug_mode = False
+        self.debug_mode = debug_mode
+        self.collision_rect = rotated_hitbox(x, y, width, height, direction)
 
     def update(self) -> None:
         """Update the bullet's position based on its speed and direction."""
         angle_rad = math.radians(self.direction)
         self.x += self.speed * math.cos(angle_rad)
         self.y -= self.speed * math.sin(angle_rad)
-        self.collision_rect.topleft = (int(self.x), int(self.y))
+        self.collision_rect = rotated_hitbox(
+            self.x, self.y, self.width, self.height, self.direction
+        )
 
         # Decrease lifetime
         self.lifetime -= 1
 
     def draw(self, screen: pygame.Surface) -> None:
         """Draw the bullet on the screen."""
-        sprite_image = pygame.image.load(self.sprite)
-        sprite_image = pygame.transform.scale(sprite_image, (self.width, self.height))
+        sprite_image = assets.scaled(self.sprite, (self.width, self.height))
         rotated_image = pygame.transform.rotate(sprite_image, self.direction)
         rotated_rect = rotated_image.get_rect(
             center=(self.x + self.width // 2, self.y + self.height // 2)
         )
 
-        # Set the collision rectangle to the rotated position
-        self.collision_rect = rotated_rect
-
         # Show the collision rectangle in debug mode
         if self.debug_mode:
             pygame.draw.rect(screen, (255, 0, 0), self.collision_rect, 1)
@@ -100,8 +166,9 @@ class Bullet(Entity):
 
 
 class BulletsManager:
-    def __init__(self) -> None:
+    def __init__(self, debug_mode: bool = False) -> None:
         self.bullets: list[Bullet] = []
+        self.debug_mode = debug_mode
 
     def draw(self, surface: pygame.Surface):
         for bullet in self.bullets:
@@ -119,13 +186,63 @@ class BulletsManager:
         for bullet in self.bullets:
             if bullet.is_dead():
                 self.delete(bullet)
+                BULLETS_EXPIRED.value += 1
 
     def shoot(self, x, y, width, height, sprite, direction=0):
-        self.bullets.append(Bullet(x, y, width, height, sprite, direction))
+        self.bullets.append(
+            Bullet(x, y, width, height, sprite, direction, self.debug_mode)
+        )
+        BULLETS_FIRED.value += 1
 
     def get_bullets(self):
         return self.bullets
 
+    def snapshot(self) -> bytes:
+        """Serialize all live bullets."""
+        pack = BULLET_STATE.pack
+        return COUNT_STATE.pack(len(self.bullets)) + b"".join(
+            pack(
+                bullet.x,
+                bullet.y,
+                bullet.direction,
+                bullet.lifetime,
+                bullet.width,
+                bullet.height,
+            )
+            for bullet in self.bullets
+        )
+
+    def restore(self, data: bytes) -> None:
+        """Replace the live bullets with the ones stored in `data`."""
+        self.apply_snapshot(self.parse_snapshot(data))
+
+    @staticmethod
+    def parse_snapshot(data: bytes) -> list[Bullet]:
+        """Build the bullets stored in `data`, raising ValueError if malformed."""
+        count = read_count(data, BULLET_STATE)
+        bullets = []
+        for x, y, direction, lifetime, width, height in BULLET_STATE.iter_unpack(
+            data[COUNT_STATE.size :]
+        ):
+            bullet = Bullet(int(x), int(y), width, height, BULLET_SPRITE, direction)
+            bullet.x = x
+            bullet.y = y
+            bullet.lifetime = lifetime
+            bullets.append(bullet)
+        return bullets
+
+    def apply_snapshot(self, bullets: list[Bullet]) -> None:
+        for bullet in bullets:
+            bullet.debug_mode = self.debug_mode
+
+        # Update in place, the asteroid manager holds a reference to this list
+        self.bullets[:] = bullets
+
+    def set_debug_mode(self, enabled: bool) -> None:
+        self.debug_mode = enabled
+        for bullet in self.bullets:
+            bullet.debug_mode = enabled
+
 
 class Player(Entity):
     def __init__(
@@ -187,8 +304,10 @@ class Player(Entity):
         self.momentum_x *= 0.99
         self.momentum_y *= 0.99
 
-        # Update the collision rectangle
-        self.collision_rect.topleft = (int(self.x), int(self.y))
+        # Update the collision rectangle to the rotated position
+        self.collision_rect = rotated_hitbox(
+            self.x, self.y, self.width, self.height, self.direction
+        )
 
         if self.shoot_cooldown > 0:
             self.shoot_cooldown -= 1
@@ -200,16 +319,12 @@ class Player(Entity):
         """Draw the player on the screen."""
 
         # Center the sprite on its position
-        sprite_image = pygame.image.load(self.sprite)
-        sprite_image = pygame.transform.scale(sprite_image, (self.width, self.height))
+        sprite_image = assets.scaled(self.sprite, (self.width, self.height))
         self.surface = pygame.transform.rotate(sprite_image, self.direction)
         rotated_rect = self.surface.get_rect(
             center=(self.x + self.width // 2, self.y + self.height // 2)
         )
 
-        # Set the collision rectangle to the rotated position
-        self.collision_rect = rotated_rect
-
         # Show the collision rectangle in debug mode
         if self.debug_mode:
             pygame.draw.rect(screen, (255, 0, 0), self.collision_rect, 1)
@@ -221,22 +336,22 @@ class Player(Entity):
         # Bullet manager draw
         self.bullet_manager.draw(screen)
 
-    def handle_input(self, keys: pygame.key.ScancodeWrapper) -> None:
-        """Handle player input for movement and actions."""
-        if keys[pygame.K_LEFT]:
+    def apply_action(self, action: int) -> None:
+        """Apply an action bitmask of ACTION_* flags to the player."""
+        if action & ACTION_LEFT:
             self.direction += self.rotation_speed
-        if keys[pygame.K_RIGHT]:
+        if action & ACTION_RIGHT:
             self.direction -= self.rotation_speed
 
         # Accelerate in the direction the player is facing
-        if keys[pygame.K_UP]:
+        if action & ACTION_THRUST:
             max_speed = 10
             if self.momentum_x**2 + self.momentum_y**2 < max_speed**2:
                 angle_rad = math.radians(self.direction + 90)
                 self.momentum_x += self.acceleration * math.cos(angle_rad)
                 self.momentum_y -= self.acceleration * math.sin(angle_rad)
 
-        if keys[pygame.K_SPACE]:
+        if action & ACTION_SHOOT:
             self.shoot()
 
     def shoot(self):
@@ -249,11 +364,11 @@ class Player(Entity):
             self.y + self.height // 2,
             5,
             5,
-            "./assets/bullet_player.png",
+            BULLET_SPRITE,
             direction=self.direction + 90,
         )
 
-        SHOOT_SOUND.play()
+        assets.sound(SHOOT_SOUND).play()
 
         self.shoot_cooldown = self.shoot_delay
 
@@ -284,6 +399,52 @@ class Player(Entity):
         self.blink_visible = True
         self.blink_timer = 0
 
+    def snapshot(self) -> bytes:
+        """Serialize the player's position, momentum, lives and timers."""
+        return PLAYER_STATE.pack(
+            self.x,
+            self.y,
+            self.direction,
+            self.momentum_x,
+            self.momentum_y,
+            self.lives,
+            self.shoot_cooldown,
+            self.invincibility_timer,
+            self.blink_timer,
+            self.is_invincible,
+            self.blink_visible,
+        )
+
+    def restore(self, data: bytes) -> None:
+        """Restore the state saved by `snapshot`."""
+        self.apply_snapshot(self.parse_snapshot(data))
+
+    @staticmethod
+    def parse_snapshot(data: bytes) -> tuple:
+        if len(data) != PLAYER_STATE.size:
+            raise ValueError(
+                f"Player state is {len(data)} bytes, expected {PLAYER_STATE.size}."
+            )
+        return PLAYER_STATE.unpack(data)
+
+    def apply_snapshot(self, state: tuple) -> None:
+        (
+            self.x,
+            self.y,
+            self.direction,
+            self.momentum_x,
+            self.momentum_y,
+            self.lives,
+            self.shoot_cooldown,
+            self.invincibility_timer,
+            self.blink_timer,
+            self.is_invincible,
+            self.blink_visible,
+        ) = state
+        self.collision_rect = rotated_hitbox(
+            self.x, self.y, self.width, self.height, self.direction
+        )
+
     def __repr__(self) -> str:
         return f"Player(x={self.x}, y={self.y}, width={self.width}, height={self.height}, sprite='{self.sprite}', health={self.lives})"
 
@@ -327,14 +488,13 @@ class Asteroid(Entity):
     def explode(self):
         self.exploded = True
 
+    def current_sprite(self) -> str:
+        return self.sprite if self.exploded == False else EXPLOSION_SPRITE
+
     def draw(self, screen: pygame.Surface) -> None:
-        sprite_to_render = (
-            self.sprite if self.exploded == False else "assets/explosion.png"
-        )
+        sprite_to_render = self.current_sprite()
 
-        sprite_image = pygame.transform.scale(
-            pygame.image.load(sprite_to_render), (self.width, self.height)
-        )
+        sprite_image = assets.scaled(sprite_to_render, (self.width, self.height))
 
         if self.debug_mode:
             pygame.draw.rect(screen, (255, 0, 0), self.collision_rect)
@@ -351,10 +511,23 @@ class Asteroid(Entity):
 
 
 class AsteroidManager:
-    def __init__(self, bullets_manager: BulletsManager, player: Player) -> None:
+    def __init__(
+        self,
+        bullets_manager: BulletsManager,
+        player: Player,
+        events: EventBus,
+        seed=None,
+        debug_mode: bool = False,
+    ) -> None:
         self.asteroids: list[Asteroid] = []
         self.bullets = bullets_manager.get_bullets()
         self.player = player
+        self.events = events
+        self.rng = random.Random(seed)
+        self.debug_mode = debug_mode
+
+        # Small asteroids created when a normal one is shot
+        self.max_fragments = 2
 
     def draw(self, surface: pygame.Surface):
         for bullet in self.asteroids:
@@ -390,64 +563,159 @@ class AsteroidManager:
         """Remove an asteroid from the list."""
         if asteroid in self.asteroids:
             self.asteroids.remove(asteroid)
+            ASTEROIDS_DESTROYED.value += 1
 
     def spawn(self, player: Player):
         """Spawn a new asteroid at a random position."""
 
-        rand_x = random.randint(0, WINDOW_WIDTH - 20)
-        rand_y = random.randint(0, WINDOW_HEIGHT - 20)
-        rand_direction = random.randint(0, 360)
+        rand_x = self.rng.randint(0, WINDOW_WIDTH - 20)
+        rand_y = self.rng.randint(0, WINDOW_HEIGHT - 20)
+        rand_direction = self.rng.randint(0, 360)
 
         # Spawn a new asteroid at a random position
         # Ensure it does not spawn on the player
         while abs(rand_x - player.x) < 50 and abs(rand_y - player.y) < 50:
-            rand_x = random.randint(0, WINDOW_WIDTH - 20)
-            rand_y = random.randint(0, WINDOW_HEIGHT - 20)
+            rand_x = self.rng.randint(0, WINDOW_WIDTH - 20)
+            rand_y = self.rng.randint(0, WINDOW_HEIGHT - 20)
 
         self.asteroids.append(
-            Asteroid(rand_x, rand_y, 70, 70, "./assets/asteroid1.png", rand_direction)
+            Asteroid(
+                rand_x,
+                rand_y,
+                70,
+                70,
+                ASTEROID_SPRITES["normal"],
+                rand_direction,
+                debug=self.debug_mode,
+            )
         )
+        ASTEROIDS_SPAWNED.value += 1
 
     def get_asteroids(self):
         return self.asteroids
 
     def check_collisions(self, entity: Entity) -> None:
         """Check for collisions with the given entity and return a list of colliding asteroids."""
+        COLLISIONS_TESTED.value += len(self.asteroids)
         for asteroid in self.asteroids:
             if asteroid.check_collision(entity):
+                COLLISIONS_HIT.value += 1
                 if isinstance(entity, Bullet):
-                    EXPLOSION_SOUND.play()
+                    assets.sound(EXPLOSION_SOUND).play()
                     asteroid.explode()
                     entity.lifetime = 0
 
                     if asteroid.type == "normal":
                         self.asteroids.extend(
-                            [
-                                Asteroid(
-                                    asteroid.x,
-                                    asteroid.y,
-                                    30,
-                                    30,
-                                    "./assets/asteroid2.png",
-                                    random.randint(0, 360),
-                                    type="small",
-                                ),
-                                Asteroid(
-                                    asteroid.x,
-                                    asteroid.y,
-                                    30,
-                                    30,
-                                    "./assets/asteroid2.png",
-                                    random.randint(0, 360),
-                                    type="small",
-                                ),
-                            ]
+                            Asteroid(
+                                asteroid.x,
+                                asteroid.y,
+                                30,
+                                30,
+                                ASTEROID_SPRITES["small"],
+                                self.rng.randint(0, 360),
+                                debug=self.debug_mode,
+                                type="small",
+                            )
+                            for _ in range(self.max_fragments)
                         )
+                        ASTEROIDS_SPAWNED.value += self.max_fragments
+                        self.events.emit(ASTEROID_SPLIT, asteroid)
 
-                    pygame.event.post(ASTEROID_SCORE_UP_EVENT)
+                    self.events.emit(SCORE_UP, asteroid)
 
                 if isinstance(entity, Player):
-                    entity.take_damage()
+                    self.events.emit(PLAYER_DAMAGED, asteroid)
+
+    def snapshot(self) -> bytes:
+        """Serialize all asteroids and the spawn RNG state."""
+        version, words, gauss_next = self.rng.getstate()
+        rng_state = RNG_STATE.pack(
+            version, *words, gauss_next is not None, gauss_next or 0.0
+        )
+
+        pack = ASTEROID_STATE.pack
+        asteroids = b"".join(
+            pack(
+                asteroid.x,
+                asteroid.y,
+                asteroid.direction,
+                asteroid.speed,
+                asteroid.width,
+                asteroid.height,
+                asteroid.explosion_timer,
+                asteroid.exploded,
+                ASTEROID_TYPES.index(asteroid.type),
+            )
+            for asteroid in self.asteroids
+        )
+
+        return rng_state + COUNT_STATE.pack(len(self.asteroids)) + asteroids
+
+    def restore(self, data: bytes) -> None:
+        """Replace the asteroids and RNG state with the ones stored in `data`."""
+        self.apply_snapshot(self.parse_snapshot(data))
+
+    @staticmethod
+    def parse_snapshot(data: bytes) -> tuple[random.Random, list[Asteroid]]:
+        """Build the RNG and asteroids stored in `data`, raising ValueError if malformed."""
+        if len(data) < RNG_STATE.size:
+            raise ValueError("Asteroid state is too short for the RNG state.")
+
+        state = RNG_STATE.unpack_from(data)
+        version, words, has_gauss, gauss_next = (
+            state[0],
+            state[1:-2],
+            state[-2],
+            state[-1],
+        )
+        rng = random.Random()
+        try:
+            rng.setstate((version, words, gauss_next if has_gauss else None))
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid RNG state: {e}") from e
+
+        data = data[RNG_STATE.size :]
+        read_count(data, ASTEROID_STATE)
+
+        asteroids = []
+        for (
+            x,
+            y,
+            direction,
+            speed,
+            width,
+            height,
+            explosion_timer,
+            exploded,
+            type_index,
+        ) in ASTEROID_STATE.iter_unpack(data[COUNT_STATE.size :]):
+            if type_index >= len(ASTEROID_TYPES):
+                raise ValueError(f"Unknown asteroid type {type_index}.")
+            type = ASTEROID_TYPES[type_index]
+            asteroid = Asteroid(
+                int(x), int(y), width, height, ASTEROID_SPRITES[type], 0, type=type
+            )
+            asteroid.x = x
+            asteroid.y = y
+            asteroid.direction = direction
+            asteroid.speed = speed
+            asteroid.explosion_timer = explosion_timer
+            asteroid.exploded = exploded
+            asteroids.append(asteroid)
+
+        return rng, asteroids
+
+    def apply_snapshot(self, state: tuple[random.Random, list[Asteroid]]) -> None:
+        self.rng, asteroids = state
+        for asteroid in asteroids:
+            asteroid.debug_mode = self.debug_mode
+        self.asteroids[:] = asteroids
+
+    def set_debug_mode(self, enabled: bool) -> None:
+        self.debug_mode = enabled
+        for asteroid in self.asteroids:
+            asteroid.debug_mode = enabled
 
     def __repr__(self) -> str:
         return f"AsteroidManager(asteroids={self.asteroids})"
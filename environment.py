@@ -0,0 +1,293 @@
+import os
+
+# The simulation never opens a window or plays audio on a real device
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import math
+import multiprocessing
+import random
+
+import numpy as np
+
+from simulation import Simulation
+from utils.constants import WINDOW_HEIGHT, WINDOW_WIDTH
+
+
+# Observation layout: player features followed by the nearest asteroids
+PLAYER_FEATURES = 8
+ASTEROID_FEATURES = 5
+OBSERVED_ASTEROIDS = 8
+OBSERVATION_SIZE = PLAYER_FEATURES + OBSERVED_ASTEROIDS * ASTEROID_FEATURES
+
+LIFE_PENALTY = 100
+
+
+class AsteroidsEnv:
+    """Headless Gym-style environment around the game simulation.
+
+    `step` takes an action bitmask of ACTION_* flags and returns
+    `(observation, reward, terminated, truncated, info)`. Observations are
+    float32 arrays of size OBSERVATION_SIZE: the player's position, momentum,
+    heading, lives and invincibility, then the offset, velocity and size of the
+    nearest asteroids (zero padded).
+    """
+
+    def __init__(self, max_steps: int = 10_000, seed=None) -> None:
+        self.max_steps = max_steps
+        self.seeds = random.Random(seed)
+        self.reset()
+
+    def reset(self, seed=None):
+        if seed is None:
+            seed = self.seeds.getrandbits(32)
+
+        self.simulation = Simulation(seed=seed)
+        self.steps = 0
+
+        return self.observe(), self.info()
+
+    @property
+    def player(self):
+        return self.simulation.player
+
+    @property
+    def asteroids_manager(self):
+        return self.simulation.asteroids_manager
+
+    @property
+    def bullet_manager(self):
+        return self.simulation.bullet_manager
+
+    @property
+    def score(self):
+        return self.simulation.score
+
+    def step(self, action: int):
+        """Apply an action and advance the simulation by one tick."""
+        reward, terminated, truncated = self.advance(action)
+        return self.observe(), reward, terminated, truncated, self.info()
+
+    def advance(self, action: int):
+        """Run one tick without building an observation."""
+        score = self.simulation.score
+        lives = self.player.lives
+
+        self.simulation.step(int(action))
+
+        self.steps += 1
+        reward = (self.simulation.score - score) - LIFE_PENALTY * (
+            lives - self.player.lives
+        )
+        terminated = self.simulation.game_over
+        truncated = self.steps >= self.max_steps
+
+        return float(reward), terminated, truncated
+
+    def observe(self, out=None) -> np.ndarray:
+        """Write the current observation into `out` (or a new array)."""
+        if out is None:
+            out = np.zeros(OBSERVATION_SIZE, dtype=np.float32)
+        else:
+            out[:] = 0
+
+        player = self.player
+        center_x = player.x + player.width / 2
+        center_y = player.y + player.height / 2
+        heading = math.radians(player.direction + 90)
+
+        out[0] = center_x / WINDOW_WIDTH
+        out[1] = center_y / WINDOW_HEIGHT
+        out[2] = player.momentum_x / 10
+        out[3] = player.momentum_y / 10
+        out[4] = math.cos(heading)
+        out[5] = math.sin(heading)
+        out[6] = player.lives / 3
+        out[7] = player.is_invincible
+
+        asteroids = self.asteroids_manager.get_asteroids()
+        if not asteroids:
+            return out
+
+        # Offsets from the player to each asteroid center, nearest first
+        nearest = sorted(
+            (
+                (
+                    asteroid.x + asteroid.width / 2 - center_x,
+                    asteroid.y + asteroid.height / 2 - center_y,
+                    asteroid,
+                )
+                for asteroid in asteroids
+            ),
+            key=lambda item: item[0] ** 2 + item[1] ** 2,
+        )[:OBSERVED_ASTEROIDS]
+
+        index = PLAYER_FEATURES
+        for dx, dy, asteroid in nearest:
+            out[index] = dx / WINDOW_WIDTH
+            out[index + 1] = dy / WINDOW_HEIGHT
+            out[index + 2] = asteroid.speed * math.cos(asteroid.direction) / 10
+            out[index + 3] = -asteroid.speed * math.sin(asteroid.direction) / 10
+            out[index + 4] = asteroid.width / 70
+            index += ASTEROID_FEATURES
+
+        return out
+
+    def snapshot(self) -> bytes:
+        """Serialize the game state, compatible with `Game.snapshot`."""
+        return self.simulation.snapshot()
+
+    def restore(self, data: bytes):
+        """Continue from a snapshot and return its observation."""
+        self.simulation.restore(data)
+        return self.observe()
+
+    def info(self) -> dict:
+        return {
+            "score": self.score,
+            "lives": self.player.lives,
+            "steps": self.steps,
+        }
+
+    def __repr__(self) -> str:
+        return f"AsteroidsEnv(score={self.score}, steps={self.steps}, lives={self.player.lives})"
+
+
+class VectorAsteroidsEnv:
+    """Steps several independent AsteroidsEnv instances with one call.
+
+    Results are stacked along the first axis. Finished environments are reset
+    automatically; the observation they finished on is kept in
+    `info["final_observation"]` and their score in `info["final_score"]`. With
+    `workers > 0` the environments are split across that many processes,
+    otherwise they are stepped in this process.
+    """
+
+    def __init__(
+        self, num_envs: int, workers: int = 0, max_steps: int = 10_000, seed=None
+    ) -> None:
+        self.num_envs = num_envs
+        seeds = random.Random(seed)
+        env_seeds = [seeds.getrandbits(32) for _ in range(num_envs)]
+
+        self.workers = []
+        if workers > 0:
+            chunks = np.array_split(np.arange(num_envs), workers)
+            for chunk in chunks:
+                if len(chunk) == 0:
+                    continue
+                parent, child = multiprocessing.Pipe()
+                process = multiprocessing.Process(
+                    target=_worker,
+                    args=(child, max_steps, [env_seeds[i] for i in chunk]),
+                    daemon=True,
+                )
+                process.start()
+                child.close()
+                self.workers.append((parent, process, chunk))
+        else:
+            self.envs = EnvBatch(max_steps, env_seeds)
+
+    def reset(self):
+        if not self.workers:
+            return self.envs.reset()
+
+        for conn, _, _ in self.workers:
+            conn.send(("reset", None))
+        return self.gather([conn.recv() for conn, _, _ in self.workers])
+
+    def step(self, actions):
+        actions = np.asarray(actions)
+        if not self.workers:
+            return self.envs.step(actions)
+
+        for conn, _, chunk in self.workers:
+            conn.send(("step", actions[chunk]))
+        return self.gather([conn.recv() for conn, _, _ in self.workers])
+
+    def gather(self, results):
+        """Concatenate the per-worker results in environment order."""
+        merged = []
+        for parts in zip(*results):
+            if isinstance(parts[0], dict):
+                merged.append(
+                    {key: np.concatenate([part[key] for part in parts]) for key in parts[0]}
+                )
+            else:
+                merged.append(np.concatenate(parts))
+        return tuple(merged)
+
+    def close(self):
+        for conn, process, _ in self.workers:
+            conn.send(("close", None))
+            process.join()
+        self.workers = []
+
+    def __repr__(self) -> str:
+        return f"VectorAsteroidsEnv(num_envs={self.num_envs}, workers={len(self.workers)})"
+
+
+class EnvBatch:
+    """A list of environments stepped together into preallocated arrays."""
+
+    def __init__(self, max_steps: int, seeds: list[int]) -> None:
+        self.envs = [AsteroidsEnv(max_steps, seed) for seed in seeds]
+        count = len(self.envs)
+        self.observations = np.zeros((count, OBSERVATION_SIZE), dtype=np.float32)
+        self.rewards = np.zeros(count, dtype=np.float32)
+        self.terminated = np.zeros(count, dtype=bool)
+        self.truncated = np.zeros(count, dtype=bool)
+        self.scores = np.zeros(count, dtype=np.int64)
+        self.final_scores = np.zeros(count, dtype=np.int64)
+        self.final_observations = np.zeros(
+            (count, OBSERVATION_SIZE), dtype=np.float32
+        )
+
+    def reset(self):
+        for i, env in enumerate(self.envs):
+            env.reset()
+            env.observe(self.observations[i])
+            self.scores[i] = 0
+        return self.observations.copy(), {"score": self.scores.copy()}
+
+    def step(self, actions):
+        self.final_scores[:] = -1
+        self.final_observations[:] = 0
+        for i, env in enumerate(self.envs):
+            reward, terminated, truncated = env.advance(actions[i])
+            self.rewards[i] = reward
+            self.terminated[i] = terminated
+            self.truncated[i] = truncated
+
+            if terminated or truncated:
+                self.final_scores[i] = env.score
+                env.observe(self.final_observations[i])
+                env.reset()
+
+            env.observe(self.observations[i])
+            self.scores[i] = env.score
+
+        return (
+            self.observations.copy(),
+            self.rewards.copy(),
+            self.terminated.copy(),
+            self.truncated.copy(),
+            {
+                "score": self.scores.copy(),
+                "final_score": self.final_scores.copy(),
+                "final_observation": self.final_observations.copy(),
+            },
+        )
+
+
+def _worker(conn, max_steps, seeds):
+    envs = EnvBatch(max_steps, seeds)
+    while True:
+        command, data = conn.recv()
+        if command == "step":
+            conn.send(envs.step(data))
+        elif command == "reset":
+            conn.send(envs.reset())
+        elif command == "close":
+            conn.close()
+            break
@@ -1,56 +1,75 @@
+import os
 import sys
+import threading
+import time
 import pygame
 
-from entities import AsteroidManager, BulletsManager, Player
+from simulation import Simulation
+from utils.assets import assets
 from utils.constants import (
-    ASTEROID_SCORE_UP_EVENT,
+    PLAYER_SPRITE,
     WINDOW_HEIGHT,
     WINDOW_WIDTH,
 )
+from utils.controls import InputBuffer
+from utils.governor import QualityGovernor
+from utils.render import RenderState, SpriteState, StateBuffer, draw_sprite
+from utils.telemetry import FRAME_TIME_BUCKETS, metrics
 from utils.ui import Button
 
 
-SPAWN_ASTEROID = pygame.USEREVENT + 10
-SPAND_ASTEROID_DELAY = 2000
-MAX_ASTEROIDS = 20
-
 pygame.init()
 pygame.display.set_caption("Azteroidz")
 
+# Telemetry
+FRAME_TIME = metrics.histogram("frame_time_ms", FRAME_TIME_BUCKETS)
+ASTEROIDS_LIVE = metrics.gauge("asteroids")
+BULLETS_LIVE = metrics.gauge("bullets")
+QUALITY_LEVEL = metrics.gauge("quality_level")
+
 
 class Game:
-    def __init__(self) -> None:
+    def __init__(self, threaded: bool = False, debug_mode: bool = False) -> None:
         # Initialize pygame the game window and clockself.clock.get_fps()
         self.window = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         self.clock = pygame.time.Clock()
         self.fps = 60
+        self.debug_mode = debug_mode
+
+        # Run the simulation on a worker thread and only render on this one
+        self.threaded = threaded
+        self.simulation_thread = None
+        self.render_buffer = StateBuffer()
+
+        # Decode assets in the background, hot-reloading them in dev mode
+        assets.start(watch=os.environ.get("ASTEROIDZ_DEV") == "1")
+
+        # Export metrics when ASTEROIDZ_TELEMETRY is "jsonl" or "prometheus"
+        telemetry_mode = os.environ.get("ASTEROIDZ_TELEMETRY")
+        if telemetry_mode:
+            try:
+                metrics.start(telemetry_mode)
+            except (OSError, ValueError) as e:
+                print(f"Telemetry disabled: {e}")
 
         # font
         self.score_font = pygame.font.SysFont("Ani", 60)
 
-        # Score
-        self.score = 0
+        # Input events, sampled once per tick before the simulation step
+        self.input = InputBuffer()
+        self.input_lock = threading.Lock()
+        self.action = 0
 
-        # custome events
-        pygame.time.set_timer(SPAWN_ASTEROID, SPAND_ASTEROID_DELAY)
-        # pygame.time.set_timer(SPAWN_ENEMY_EVENT, 3000)
+        # Held by the simulation thread while it steps, so the main thread
+        # never sees a half-finished tick
+        self.simulation_lock = threading.Lock()
 
-        # Managers
+        # Entities, score and game rules
+        self.simulation = Simulation(self.fps, debug_mode=self.debug_mode)
 
-        self.player_bullet_manager = BulletsManager()
-        # Create the entities
-        self.player = Player(
-            WINDOW_WIDTH // 2,
-            WINDOW_HEIGHT // 2,
-            40,
-            60,
-            "./assets/player.png",
-            self.player_bullet_manager,
-        )
-
-        self.asteroids_manager = AsteroidManager(
-            self.player_bullet_manager, self.player
-        )
+        # Quality settings follow the measured frame times
+        self.governor = QualityGovernor(self.fps)
+        self.apply_quality()
 
         # Game run conditions
         self.is_running = True
@@ -66,34 +85,66 @@ class Game:
             50,
             self.score_font,
             (255, 255, 255),
-            action=lambda: self.__init__(),
+            action=lambda: self.__init__(self.threaded, self.debug_mode),
         )
 
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
+                # Let the simulation thread finish its tick before shutting
+                # down the mixer and display it may still be using
+                self.is_running = False
+                if self.simulation_thread is not None:
+                    self.simulation_thread.join()
+
+                metrics.close()
+                assets.close()
                 pygame.quit()
                 sys.exit()
 
-            if (
-                event.type == SPAWN_ASTEROID
-                and len(self.asteroids_manager.get_asteroids()) < MAX_ASTEROIDS
-            ):
-                self.asteroids_manager.spawn(self.player)
+            with self.input_lock:
+                self.input.process(event)
+
+    @property
+    def player(self):
+        return self.simulation.player
+
+    @property
+    def asteroids_manager(self):
+        return self.simulation.asteroids_manager
+
+    @property
+    def player_bullet_manager(self):
+        return self.simulation.bullet_manager
 
-            if event == ASTEROID_SCORE_UP_EVENT:
-                self.score += 25
+    @property
+    def score(self):
+        return self.simulation.score
+
+    def apply_quality(self):
+        """Apply the governor's current quality level."""
+        settings = self.governor.settings
+        with self.simulation_lock:
+            self.simulation.set_spawn_delay(settings.spawn_delay)
+            self.simulation.max_asteroids = settings.max_asteroids
+            self.asteroids_manager.max_fragments = settings.max_fragments
+            # The governor can hide debug overlays but never turns them on
+            self.simulation.set_debug_mode(self.debug_mode and settings.debug_overlays)
 
     def handle_input(self):
-        keys = pygame.key.get_pressed()
-        self.player.handle_input(keys)
+        with self.input_lock:
+            frame = self.input.sample()
+
+        if not self.game_over:
+            self.action = frame.action
+            return
 
-        # Handle mouse events for the retry button
-        mouse_pos = pygame.mouse.get_pos()
-        mouse_click = pygame.mouse.get_pressed()
-        if self.retry_button.is_clicked(mouse_pos) and mouse_click[0]:
-            # If the retry button is clicked, reset the game
-            self.retry_button.handle_click()
+        # Each click fires the retry button once, however long it is held
+        for pos in frame.clicks:
+            if self.retry_button.is_clicked(pos):
+                # If the retry button is clicked, reset the game
+                self.retry_button.handle_click()
+                break
 
     def draw_game_over(self):
         # Show game over message and retry button
@@ -169,29 +220,119 @@ class Game:
             self.draw_game_over()
             return
 
-        for i in range(self.player.lives):
-            life_icon = pygame.transform.grayscale(
-                (pygame.image.load("./assets/player.png"))
-            )
+        self.draw_lives(self.player.lives)
+        self.draw_loading()
 
-            life_icon = pygame.transform.scale(life_icon, (20, 30))
+    def draw_lives(self, lives):
+        for i in range(lives):
+            life_icon = assets.scaled(PLAYER_SPRITE, (20, 30), grayscale=True)
             self.window.blit(life_icon, (10 + i * 35, 110))
 
+    def draw_loading(self):
+        """Show loading progress until every asset is decoded."""
+        if not assets.done:
+            loading_surface = self.score_font.render(
+                f"Loading {assets.progress:.0%}", True, (255, 255, 255)
+            )
+            self.window.blit(loading_surface, (WINDOW_WIDTH - 250, 10))
+
+    def draw_state(self, state: RenderState):
+        """Draw a render state published by the simulation thread."""
+        self.window.fill((0, 0, 0))
+
+        score_surface = self.score_font.render(str(state.score), True, (255, 255, 155))
+        self.window.blit(score_surface, (10, 10))
+
+        draw_sprite(self.window, state.player)
+        for bullet in state.bullets:
+            draw_sprite(self.window, bullet)
+        for asteroid in state.asteroids:
+            draw_sprite(self.window, asteroid)
+
+        self.draw_lives(state.lives)
+        self.draw_loading()
+
+    def render_state(self) -> RenderState:
+        """Copy what the renderer needs out of the entities."""
+        player = self.player
+        return RenderState(
+            self.simulation.tick,
+            self.score,
+            player.lives,
+            SpriteState(
+                player.sprite,
+                player.x,
+                player.y,
+                player.width,
+                player.height,
+                player.direction,
+                not player.is_invincible or player.blink_visible,
+                player.collision_rect.copy() if player.debug_mode else None,
+            ),
+            tuple(
+                SpriteState(
+                    bullet.sprite,
+                    bullet.x,
+                    bullet.y,
+                    bullet.width,
+                    bullet.height,
+                    bullet.direction,
+                    True,
+                    bullet.collision_rect.copy() if bullet.debug_mode else None,
+                )
+                for bullet in self.player_bullet_manager.get_bullets()
+            ),
+            tuple(
+                SpriteState(
+                    asteroid.current_sprite(),
+                    asteroid.x,
+                    asteroid.y,
+                    asteroid.width,
+                    asteroid.height,
+                    None,
+                    True,
+                    asteroid.collision_rect.copy() if asteroid.debug_mode else None,
+                )
+                for asteroid in self.asteroids_manager.get_asteroids()
+            ),
+        )
+
     def update(self):
-        self.draw()
+        self.step()
 
-        # Call entity update methods
-        self.player.update()
-        self.asteroids_manager.update()
+        # Draw the state just simulated, so input shows up on this frame
+        self.draw()
 
-    def handle_space_damage(self):
-        if (
-            self.player.x < 0 - 100
-            or self.player.x > WINDOW_WIDTH + 100
-            or self.player.y < 0 - 100
-            or self.player.y > WINDOW_HEIGHT + 100
-        ):
-            self.player.take_damage()
+    def step(self):
+        """Advance the simulation by one tick without drawing."""
+        self.simulation.step(self.action)
+
+    def record_metrics(self):
+        """Record this frame's metrics and sample them once per second."""
+        # Raw time excludes the delay tick() spends holding the frame rate
+        frame_time = self.clock.get_rawtime()
+        FRAME_TIME.observe(frame_time)
+        if self.governor.record(frame_time):
+            self.apply_quality()
+
+        if self.governor.frames % self.fps == 0:
+            ASTEROIDS_LIVE.value = len(self.asteroids_manager.get_asteroids())
+            BULLETS_LIVE.value = len(self.player_bullet_manager.get_bullets())
+            QUALITY_LEVEL.value = self.governor.level
+            metrics.sample()
+
+    def snapshot(self) -> bytes:
+        """Serialize the running game, taken between ticks."""
+        with self.simulation_lock:
+            return self.simulation.snapshot()
+
+    def restore(self, data: bytes) -> None:
+        """Continue the game from a snapshot."""
+        with self.simulation_lock:
+            self.simulation.restore(data)
+            self.game_over = self.simulation.game_over
+            # Do not let the renderer show the frame from before the restore
+            self.render_buffer.publish(self.render_state())
 
     def load_high_score(self):
         """Load single high score from a file."""
@@ -206,16 +347,70 @@ class Game:
         with open("high_score.txt", "w") as file:
             file.write(f"{score}\n")
 
-    def run(self):
+    def simulate(self):
+        """Simulation thread: step at a fixed rate and publish render states."""
+        interval = 1 / self.fps
+        next_tick = time.perf_counter()
+        while self.is_running and not self.game_over:
+            self.handle_input()
+            with self.simulation_lock:
+                self.step()
+                self.game_over = self.simulation.game_over
+                self.render_buffer.publish(self.render_state())
+
+            next_tick += interval
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Running behind, do not try to catch up with a burst of ticks
+                next_tick = time.perf_counter()
+
+    def run_threaded(self):
         while self.is_running:
+            assets.update()
+            self.handle_events()
+
             if not self.game_over:
-                self.update()
+                if (
+                    self.simulation_thread is None
+                    or not self.simulation_thread.is_alive()
+                ):
+                    # (Re)started after a retry or a restore ends a game over
+                    self.simulation_thread = threading.Thread(
+                        target=self.simulate, name="simulation", daemon=True
+                    )
+                    self.simulation_thread.start()
+
+                state = self.render_buffer.latest()
+                if state is not None:
+                    self.draw_state(state)
             else:
+                # The simulation stops on game over; input is ours again
+                if self.simulation_thread is not None:
+                    self.simulation_thread.join()
                 self.draw_game_over()
+                self.handle_input()
+
+            pygame.display.flip()
+            self.clock.tick(self.fps)
+            self.record_metrics()
+
+    def run(self):
+        if self.threaded:
+            self.run_threaded()
+            return
 
+        while self.is_running:
+            assets.update()
             self.handle_events()
             self.handle_input()
-            self.handle_space_damage()
+
+            if not self.game_over:
+                self.update()
+            else:
+                self.draw_game_over()
 
             pygame.display.flip()
             self.clock.tick(self.fps)
+            self.record_metrics()
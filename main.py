@@ -1,6 +1,8 @@
+import sys
+
 from game import Game
 
 
 if __name__ == "__main__":
-    game = Game()
+    game = Game(threaded="--threaded" in sys.argv, debug_mode="--debug" in sys.argv)
     game.run()
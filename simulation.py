@@ -0,0 +1,129 @@
+from entities import AsteroidManager, BulletsManager, Player
+from utils.constants import (
+    MAX_ASTEROIDS,
+    PLAYER_SPRITE,
+    SPAND_ASTEROID_DELAY,
+    WINDOW_HEIGHT,
+    WINDOW_WIDTH,
+)
+from utils.events import PLAYER_DAMAGED, SCORE_UP, SPAWN_ASTEROID, EventBus
+from utils.snapshot import pack_snapshot, unpack_snapshot
+from utils.telemetry import metrics
+
+SCORE_PER_HIT = 25
+
+# Telemetry
+SCORE_POINTS = metrics.counter("score_points")
+
+
+class Simulation:
+    """The game rules, shared by the windowed game and the headless environment.
+
+    `step` applies an action bitmask and advances every entity by one tick.
+    Nothing here draws, so it runs the same with or without a window.
+    """
+
+    def __init__(self, fps: int = 60, seed=None, debug_mode: bool = False) -> None:
+        self.fps = fps
+
+        # Gameplay events, dispatched once per tick
+        self.events = EventBus()
+        self.events.subscribe(SCORE_UP, self.on_score_up)
+        self.events.subscribe(PLAYER_DAMAGED, self.on_player_damaged)
+        self.events.subscribe(SPAWN_ASTEROID, self.on_spawn_asteroid)
+
+        self.bullet_manager = BulletsManager(debug_mode)
+        self.player = Player(
+            WINDOW_WIDTH // 2,
+            WINDOW_HEIGHT // 2,
+            40,
+            60,
+            PLAYER_SPRITE,
+            self.bullet_manager,
+            debug_mode,
+        )
+        self.asteroids_manager = AsteroidManager(
+            self.bullet_manager, self.player, self.events, seed, debug_mode
+        )
+
+        self.score = 0
+        self.tick = 0
+
+        # Asteroid spawning, the quality governor may change these
+        self.max_asteroids = MAX_ASTEROIDS
+        self.set_spawn_delay(SPAND_ASTEROID_DELAY)
+        self.spawn_timer = self.spawn_delay
+
+    @property
+    def game_over(self) -> bool:
+        return self.player.lives <= 0
+
+    def set_spawn_delay(self, delay: int) -> None:
+        """Set the asteroid spawn delay in milliseconds."""
+        self.spawn_delay = delay * self.fps // 1000
+
+    def set_debug_mode(self, enabled: bool) -> None:
+        """Show or hide the collision rectangles of every entity."""
+        self.player.debug_mode = enabled
+        self.bullet_manager.set_debug_mode(enabled)
+        self.asteroids_manager.set_debug_mode(enabled)
+
+    def on_score_up(self, event):
+        self.score += SCORE_PER_HIT
+        SCORE_POINTS.value += SCORE_PER_HIT
+
+    def on_player_damaged(self, event):
+        self.player.take_damage()
+
+    def on_spawn_asteroid(self, event):
+        if len(self.asteroids_manager.get_asteroids()) < self.max_asteroids:
+            self.asteroids_manager.spawn(self.player)
+
+    def step(self, action: int) -> None:
+        """Apply an action and advance the simulation by one tick."""
+        self.player.apply_action(action)
+
+        # Call entity update methods
+        self.player.update()
+        self.asteroids_manager.update()
+
+        self.spawn_timer -= 1
+        if self.spawn_timer <= 0:
+            self.spawn_timer = self.spawn_delay
+            self.events.emit(SPAWN_ASTEROID)
+
+        # Deliver this tick's gameplay events
+        self.events.dispatch()
+
+        self.handle_space_damage()
+        self.tick += 1
+
+    def handle_space_damage(self):
+        """Drifting too far off screen costs a life."""
+        if (
+            self.player.x < 0 - 100
+            or self.player.x > WINDOW_WIDTH + 100
+            or self.player.y < 0 - 100
+            or self.player.y > WINDOW_HEIGHT + 100
+        ):
+            self.player.take_damage()
+
+    def snapshot(self) -> bytes:
+        """Serialize the simulation. Only call it between ticks."""
+        return pack_snapshot(
+            self.score,
+            self.spawn_timer,
+            self.player,
+            self.asteroids_manager,
+            self.bullet_manager,
+        )
+
+    def restore(self, data: bytes) -> None:
+        """Continue from a snapshot."""
+        self.score, self.spawn_timer = unpack_snapshot(
+            data, self.player, self.asteroids_manager, self.bullet_manager
+        )
+        self.events.clear()
+
+    def __repr__(self) -> str:
+        return f"Simulation(tick={self.tick}, score={self.score}, lives={self.player.lives})"
@@ -0,0 +1,46 @@
+import pygame
+
+from utils.constants import ACTION_LEFT, ACTION_SHOOT
+from utils.controls import InputBuffer
+
+
+def key(type, key):
+    return pygame.event.Event(type, key=key)
+
+
+def test_tap_within_one_tick_sets_the_action():
+    buffer = InputBuffer()
+    buffer.process(key(pygame.KEYDOWN, pygame.K_SPACE))
+    buffer.process(key(pygame.KEYUP, pygame.K_SPACE))
+
+    assert buffer.sample().action & ACTION_SHOOT
+    assert buffer.sample().action == 0
+
+
+def test_held_key_lasts_until_released():
+    buffer = InputBuffer()
+    buffer.process(key(pygame.KEYDOWN, pygame.K_LEFT))
+
+    assert buffer.sample().action == ACTION_LEFT
+    assert buffer.sample().action == ACTION_LEFT
+
+    buffer.process(key(pygame.KEYUP, pygame.K_LEFT))
+    assert buffer.sample().action == 0
+
+
+def test_focus_loss_releases_held_keys():
+    buffer = InputBuffer()
+    buffer.process(key(pygame.KEYDOWN, pygame.K_LEFT))
+    assert buffer.sample().action == ACTION_LEFT
+
+    buffer.process(pygame.event.Event(pygame.WINDOWFOCUSLOST))
+    assert buffer.sample().action == 0
+
+
+def test_click_fires_once():
+    buffer = InputBuffer()
+    buffer.process(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(10, 20)))
+    buffer.process(pygame.event.Event(pygame.MOUSEBUTTONUP, button=1, pos=(10, 20)))
+
+    assert buffer.sample().clicks == [(10, 20)]
+    assert buffer.sample().clicks == []
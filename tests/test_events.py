@@ -0,0 +1,41 @@
+from utils.events import SCORE_UP, EventBus
+
+
+def test_burst_past_capacity_is_delivered_in_order():
+    bus = EventBus(capacity=4)
+    received = []
+    bus.subscribe(SCORE_UP, lambda event: received.append(event.data))
+
+    # Move head off zero so the burst wraps around the end of the buffer
+    for i in range(3):
+        bus.emit(SCORE_UP, i)
+    assert bus.dispatch() == 3
+    assert bus.head == 3
+
+    received.clear()
+    for i in range(10):
+        bus.emit(SCORE_UP, i)
+
+    assert bus.dispatch() == 10
+    assert received == list(range(10))
+    assert len(bus) == 0
+
+
+def test_events_emitted_while_dispatching_wait_for_the_next_dispatch():
+    bus = EventBus()
+    received = []
+
+    def on_score_up(event):
+        received.append(event.data)
+        if event.data < 3:
+            bus.emit(SCORE_UP, event.data + 1)
+
+    bus.subscribe(SCORE_UP, on_score_up)
+    bus.emit(SCORE_UP, 0)
+
+    assert bus.dispatch() == 1
+    assert received == [0]
+    assert len(bus) == 1
+
+    assert bus.dispatch() == 1
+    assert received == [0, 1]
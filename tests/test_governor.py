@@ -0,0 +1,27 @@
+from utils.governor import QualityGovernor
+
+
+def test_frame_times_between_thresholds_keep_the_level():
+    governor = QualityGovernor(60)
+    governor.level = 1
+
+    # Alternate just under the downgrade and just over the upgrade threshold
+    low = governor.budget * governor.upgrade_ratio + 0.5
+    high = governor.budget * governor.downgrade_ratio - 0.5
+    for frame in range(1000):
+        assert not governor.record(high if frame % 2 else low)
+
+    assert governor.level == 1
+
+
+def test_level_changes_wait_for_the_cooldown():
+    governor = QualityGovernor(60)
+    slow = governor.budget * 3
+
+    changes = [frame for frame in range(1000) if governor.record(slow)]
+
+    assert governor.level == 3
+    assert len(changes) == 3
+    assert changes[0] >= governor.cooldown - 1
+    for previous, current in zip(changes, changes[1:]):
+        assert current - previous >= governor.cooldown
@@ -0,0 +1,48 @@
+import pytest
+
+from simulation import Simulation
+
+
+def play(simulation, ticks):
+    """Drive the simulation with a fixed mix of turning, thrusting and shooting."""
+    for tick in range(ticks):
+        simulation.step((tick * 7) % 16)
+
+
+def test_restore_replays_exactly():
+    original = Simulation(seed=1)
+    play(original, 600)
+    snapshot = original.snapshot()
+
+    fork = Simulation(seed=2)
+    fork.restore(snapshot)
+    assert fork.snapshot() == snapshot
+
+    play(original, 600)
+    play(fork, 600)
+    assert fork.score == original.score
+    assert fork.snapshot() == original.snapshot()
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        lambda data: data[: len(data) // 2],
+        lambda data: data[:-1],
+        lambda data: data + b"\0",
+        lambda data: b"XXXX" + data[4:],
+        lambda data: data[:10],
+    ],
+)
+def test_malformed_snapshot_leaves_state_untouched(corrupt):
+    source = Simulation(seed=3)
+    play(source, 900)
+
+    simulation = Simulation(seed=4)
+    play(simulation, 30)
+    before = simulation.snapshot()
+
+    with pytest.raises(ValueError):
+        simulation.restore(corrupt(source.snapshot()))
+
+    assert simulation.snapshot() == before
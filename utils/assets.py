@@ -0,0 +1,198 @@
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from utils.telemetry import metrics
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+SOUND_EXTENSIONS = (".wav", ".mp3", ".ogg")
+
+# Telemetry
+CACHE_HITS = metrics.counter("asset_cache_hits")
+CACHE_MISSES = metrics.counter("asset_cache_misses")
+
+
+class SilentSound:
+    """Stands in for a sound that has not finished loading."""
+
+    def play(self, *args, **kwargs) -> None:
+        pass
+
+    def __repr__(self) -> str:
+        return "SilentSound()"
+
+
+class AssetManager:
+    """Decodes images and sounds on a thread pool and serves them by path.
+
+    Decoded assets are handed to the main thread through a queue and installed
+    by `update`, which never blocks. Until an asset is installed, `scaled` and
+    `sound` return placeholders. With `watch=True` a background thread polls
+    the directory and reloads files whose modification time changes.
+
+    Assets are keyed by normalized path, `os.path.join("assets", "player.png")`.
+    Lookups use the path as given, so normalize it once up front rather than
+    per call.
+    """
+
+    def __init__(
+        self, directory: str = "assets", workers: int = 4, poll_interval: float = 1.0
+    ) -> None:
+        self.directory = os.path.normpath(directory)
+        self.workers = workers
+        self.poll_interval = poll_interval
+
+        self.images: dict[str, pygame.Surface] = {}
+        self.sounds: dict[str, pygame.mixer.Sound] = {}
+        self.scaled_cache: dict[tuple, pygame.Surface] = {}
+        self.placeholders: dict[tuple, pygame.Surface] = {}
+        self.silent = SilentSound()
+
+        self.loaded: queue.SimpleQueue = queue.SimpleQueue()
+        self.mtimes: dict[str, float] = {}
+        self.total = 0
+        self.completed = 0
+        self.startup: set[str] = set()  # startup assets not installed yet
+        self.pool = None
+        self.watcher = None
+        self.stopped = threading.Event()
+
+    @property
+    def started(self) -> bool:
+        return self.pool is not None
+
+    @property
+    def progress(self) -> float:
+        """Fraction of the startup assets installed so far."""
+        if self.total == 0:
+            return 1.0 if self.started else 0.0
+        return self.completed / self.total
+
+    @property
+    def done(self) -> bool:
+        return self.started and self.completed >= self.total
+
+    def start(self, watch: bool = False) -> None:
+        """Start decoding every asset in the directory in the background."""
+        if self.started:
+            return
+
+        self.pool = ThreadPoolExecutor(self.workers, thread_name_prefix="assets")
+        paths = self.scan()
+        self.total = len(paths)
+        self.startup = set(paths)
+        for path, mtime in paths.items():
+            self.mtimes[path] = mtime
+            self.pool.submit(self.decode, path)
+
+        if watch:
+            self.watcher = threading.Thread(
+                target=self.watch, name="assets-watcher", daemon=True
+            )
+            self.watcher.start()
+
+    def scan(self) -> dict[str, float]:
+        """Return the modification time of every supported file in the directory."""
+        paths = {}
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.lower().endswith(IMAGE_EXTENSIONS + SOUND_EXTENSIONS):
+                paths[path] = os.path.getmtime(path)
+        return paths
+
+    def decode(self, path: str) -> None:
+        """Decode a file on a worker thread and queue it for the main thread."""
+        try:
+            if path.lower().endswith(IMAGE_EXTENSIONS):
+                asset = pygame.image.load(path)
+            else:
+                asset = pygame.mixer.Sound(path)
+        except (pygame.error, OSError) as e:
+            print(f"Failed to load {path}: {e}")
+            asset = None
+        self.loaded.put((path, asset))
+
+    def watch(self) -> None:
+        """Poll the directory and reload files that changed."""
+        while not self.stopped.wait(self.poll_interval):
+            try:
+                paths = self.scan()
+            except OSError:
+                continue
+
+            for path, mtime in paths.items():
+                if self.mtimes.get(path) != mtime:
+                    self.mtimes[path] = mtime
+                    self.pool.submit(self.decode, path)
+
+    def update(self) -> None:
+        """Install assets decoded since the last call. Call once per frame."""
+        while True:
+            try:
+                path, asset = self.loaded.get_nowait()
+            except queue.Empty:
+                break
+
+            if isinstance(asset, pygame.Surface):
+                self.images[path] = asset
+                self.scaled_cache = {
+                    key: surface
+                    for key, surface in self.scaled_cache.items()
+                    if key[0] != path
+                }
+            elif asset is not None:
+                self.sounds[path] = asset
+
+            # Reloads of a file arriving during startup do not count twice
+            if path in self.startup:
+                self.startup.discard(path)
+                self.completed += 1
+
+    def scaled(
+        self, path: str, size: tuple[int, int], grayscale: bool = False
+    ) -> pygame.Surface:
+        """Return the image scaled to `size`, cached until the file is reloaded."""
+        key = (path, size, grayscale)
+        surface = self.scaled_cache.get(key)
+        if surface is not None:
+            CACHE_HITS.value += 1
+            return surface
+
+        CACHE_MISSES.value += 1
+        image = self.images.get(path)
+        if image is None:
+            return self.placeholder(size)
+
+        surface = pygame.transform.scale(image, size)
+        if grayscale:
+            surface = pygame.transform.grayscale(surface)
+        self.scaled_cache[key] = surface
+        return surface
+
+    def sound(self, path: str):
+        return self.sounds.get(path, self.silent)
+
+    def placeholder(self, size: tuple[int, int]) -> pygame.Surface:
+        """A translucent gray box shown in place of an image still loading."""
+        key = tuple(size)
+        surface = self.placeholders.get(key)
+        if surface is None:
+            surface = pygame.Surface(key, pygame.SRCALPHA)
+            surface.fill((128, 128, 128, 96))
+            self.placeholders[key] = surface
+        return surface
+
+    def close(self) -> None:
+        self.stopped.set()
+        if self.pool is not None:
+            self.pool.shutdown(wait=False)
+
+    def __repr__(self) -> str:
+        return f"AssetManager(directory='{self.directory}', progress={self.progress:.0%})"
+
+
+# Shared by the entities and the game
+assets = AssetManager()
@@ -6,12 +6,22 @@ pygame.mixer.init()
 WINDOW_HEIGHT = 800
 WINDOW_WIDTH = 1000
 
+SPAND_ASTEROID_DELAY = 2000
+MAX_ASTEROIDS = 20
 
-EXPLOSION_SOUND = pygame.mixer.Sound("assets/enemy_explode.wav")
-SHOOT_SOUND = pygame.mixer.Sound("assets/shoot.mp3")
+# Asset paths, joined with the platform separator to match the asset keys.
+# Sounds are decoded in the background by utils.assets
+PLAYER_SPRITE = path.join("assets", "player.png")
+EXPLOSION_SPRITE = path.join("assets", "explosion.png")
+EXPLOSION_SOUND = path.join("assets", "enemy_explode.wav")
+SHOOT_SOUND = path.join("assets", "shoot.mp3")
 
 
-ASTEROID_SCORE_UP_EVENT = pygame.event.Event(pygame.USEREVENT + 1)
+# Player actions, combined as a bitmask
+ACTION_LEFT = 1
+ACTION_RIGHT = 2
+ACTION_THRUST = 4
+ACTION_SHOOT = 8
 
 # Spawn enemy event
 SPAWN_ENEMY_EVENT = pygame.event.Event(pygame.USEREVENT + 2)
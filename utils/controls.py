@@ -0,0 +1,73 @@
+import pygame
+
+from utils.constants import ACTION_LEFT, ACTION_RIGHT, ACTION_SHOOT, ACTION_THRUST
+
+KEY_ACTIONS = {
+    pygame.K_LEFT: ACTION_LEFT,
+    pygame.K_RIGHT: ACTION_RIGHT,
+    pygame.K_UP: ACTION_THRUST,
+    pygame.K_SPACE: ACTION_SHOOT,
+}
+
+
+class InputFrame:
+    """Input sampled for a single tick."""
+
+    __slots__ = ("tick", "action", "clicks")
+
+    def __init__(self, tick: int, action: int, clicks: list) -> None:
+        self.tick = tick
+        self.action = action  # actions held or tapped during the tick
+        self.clicks = clicks  # positions of left mouse button presses
+
+    def __repr__(self) -> str:
+        return f"InputFrame(tick={self.tick}, action={self.action}, clicks={self.clicks})"
+
+
+class InputBuffer:
+    """Collects input events between ticks and turns them into an InputFrame.
+
+    Keys pressed and released within the same tick still count for that tick,
+    and mouse clicks fire once per button press rather than while held.
+    """
+
+    def __init__(self) -> None:
+        self.pending: list[tuple[int, object]] = []
+        self.held = 0
+        self.tick = 0
+
+    def process(self, event: pygame.event.Event) -> None:
+        """Buffer a pygame event until the next sample."""
+        if event.type in (pygame.KEYDOWN, pygame.KEYUP):
+            if event.key in KEY_ACTIONS:
+                self.pending.append((event.type, event.key))
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            self.pending.append((event.type, event.pos))
+        elif event.type == pygame.WINDOWFOCUSLOST:
+            # Key releases are not delivered once the window loses focus
+            self.pending.append((event.type, None))
+
+    def sample(self) -> InputFrame:
+        """Fold the buffered events into the input for the next tick."""
+        pressed = 0
+        tapped = 0
+        clicks = []
+        for type, value in self.pending:
+            if type == pygame.KEYDOWN:
+                pressed |= KEY_ACTIONS[value]
+                self.held |= KEY_ACTIONS[value]
+            elif type == pygame.KEYUP:
+                tapped |= KEY_ACTIONS[value] & pressed
+                self.held &= ~KEY_ACTIONS[value]
+            elif type == pygame.MOUSEBUTTONDOWN:
+                clicks.append(value)
+            elif type == pygame.WINDOWFOCUSLOST:
+                self.held = 0
+
+        self.pending.clear()
+        frame = InputFrame(self.tick, self.held | tapped, clicks)
+        self.tick += 1
+        return frame
+
+    def __repr__(self) -> str:
+        return f"InputBuffer(held={self.held}, pending={len(self.pending)})"
@@ -0,0 +1,86 @@
+from typing import Any, Callable
+
+# Gameplay event types
+SCORE_UP = "score_up"
+PLAYER_DAMAGED = "player_damaged"
+SPAWN_ASTEROID = "spawn_asteroid"
+ASTEROID_SPLIT = "asteroid_split"
+
+
+class GameEvent:
+    __slots__ = ("type", "data")
+
+    def __init__(self, type: str, data: Any = None) -> None:
+        self.type = type
+        self.data = data
+
+    def __repr__(self) -> str:
+        return f"GameEvent(type='{self.type}', data={self.data})"
+
+
+class EventBus:
+    """In-process event queue for gameplay events.
+
+    Events are stored in a ring buffer and delivered to subscribers when
+    `dispatch` is called, once per tick. The buffer grows instead of dropping
+    events, so bursts of hits are never lost.
+    """
+
+    def __init__(self, capacity: int = 64) -> None:
+        self.buffer: list[GameEvent | None] = [None] * capacity
+        self.head = 0
+        self.size = 0
+        self.subscribers: dict[str, list[Callable[[GameEvent], None]]] = {}
+
+    def subscribe(self, type: str, callback: Callable[[GameEvent], None]) -> None:
+        self.subscribers.setdefault(type, []).append(callback)
+
+    def unsubscribe(self, type: str, callback: Callable[[GameEvent], None]) -> None:
+        callbacks = self.subscribers.get(type, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+    def emit(self, type: str, data: Any = None) -> None:
+        """Queue an event to be delivered on the next dispatch."""
+        if self.size == len(self.buffer):
+            self.grow()
+
+        tail = (self.head + self.size) % len(self.buffer)
+        self.buffer[tail] = GameEvent(type, data)
+        self.size += 1
+
+    def grow(self) -> None:
+        """Double the buffer capacity, keeping queued events in order."""
+        capacity = len(self.buffer)
+        ordered = self.buffer[self.head :] + self.buffer[: self.head]
+        self.buffer = ordered + [None] * capacity
+        self.head = 0
+
+    def dispatch(self) -> int:
+        """Deliver the queued events to their subscribers.
+
+        Only the events queued before the call are delivered; events emitted by
+        subscribers wait for the next dispatch. Returns the number delivered.
+        """
+        count = self.size
+        for _ in range(count):
+            event = self.buffer[self.head]
+            self.buffer[self.head] = None
+            self.head = (self.head + 1) % len(self.buffer)
+            self.size -= 1
+
+            for callback in self.subscribers.get(event.type, ()):
+                callback(event)
+
+        return count
+
+    def clear(self) -> None:
+        self.buffer = [None] * len(self.buffer)
+        self.head = 0
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __repr__(self) -> str:
+        return f"EventBus(queued={self.size}, capacity={len(self.buffer)})"
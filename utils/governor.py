@@ -0,0 +1,124 @@
+from collections import deque
+
+from utils.constants import MAX_ASTEROIDS, SPAND_ASTEROID_DELAY
+
+
+class QualityLevel:
+    def __init__(
+        self,
+        debug_overlays: bool,
+        max_fragments: int,
+        spawn_delay: int,
+        max_asteroids: int,
+    ) -> None:
+        self.debug_overlays = debug_overlays
+        self.max_fragments = max_fragments  # small asteroids per split
+        self.spawn_delay = spawn_delay  # milliseconds
+        self.max_asteroids = max_asteroids
+
+    def __repr__(self) -> str:
+        return f"QualityLevel(debug_overlays={self.debug_overlays}, max_fragments={self.max_fragments}, spawn_delay={self.spawn_delay}, max_asteroids={self.max_asteroids})"
+
+
+# From full quality down to the cheapest settings
+QUALITY_LEVELS = [
+    QualityLevel(True, 2, SPAND_ASTEROID_DELAY, MAX_ASTEROIDS),
+    QualityLevel(False, 2, SPAND_ASTEROID_DELAY * 5 // 4, MAX_ASTEROIDS * 3 // 4),
+    QualityLevel(False, 1, SPAND_ASTEROID_DELAY * 3 // 2, MAX_ASTEROIDS // 2),
+    QualityLevel(False, 1, SPAND_ASTEROID_DELAY * 2, MAX_ASTEROIDS * 2 // 5),
+]
+
+
+class QualityGovernor:
+    """Picks a quality level that keeps frames within the frame-time budget.
+
+    Frame times are averaged over the last `window` frames. The level drops
+    when the average goes over `budget * downgrade_ratio` and rises again only
+    once it falls below `budget * upgrade_ratio`. After a change the governor
+    waits `cooldown` frames before changing again, so it does not oscillate.
+    """
+
+    def __init__(
+        self,
+        target_fps: int = 60,
+        window: int = 30,
+        downgrade_ratio: float = 1.1,
+        upgrade_ratio: float = 0.7,
+        cooldown: int = 120,
+    ) -> None:
+        self.budget = 1000 / target_fps
+        self.downgrade_ratio = downgrade_ratio
+        self.upgrade_ratio = upgrade_ratio
+        self.cooldown = cooldown
+
+        self.frame_times: deque[float] = deque(maxlen=window)
+        self.total = 0.0
+        self.level = 0
+        self.frames_since_change = 0
+
+        # Metrics
+        self.frames = 0
+        self.frames_over_budget = 0
+        self.worst_frame_time = 0.0
+        self.downgrades = 0
+        self.upgrades = 0
+
+    @property
+    def settings(self) -> QualityLevel:
+        return QUALITY_LEVELS[self.level]
+
+    @property
+    def average_frame_time(self) -> float:
+        if not self.frame_times:
+            return 0.0
+        return self.total / len(self.frame_times)
+
+    def record(self, frame_time: float) -> bool:
+        """Record a frame time in milliseconds. Returns True if the level changed."""
+        if len(self.frame_times) == self.frame_times.maxlen:
+            self.total -= self.frame_times[0]
+        self.frame_times.append(frame_time)
+        self.total += frame_time
+
+        self.frames += 1
+        self.frames_since_change += 1
+        if frame_time > self.budget:
+            self.frames_over_budget += 1
+        self.worst_frame_time = max(self.worst_frame_time, frame_time)
+
+        if (
+            self.frames_since_change < self.cooldown
+            or len(self.frame_times) < self.frame_times.maxlen
+        ):
+            return False
+
+        average = self.average_frame_time
+        if (
+            average > self.budget * self.downgrade_ratio
+            and self.level < len(QUALITY_LEVELS) - 1
+        ):
+            self.level += 1
+            self.downgrades += 1
+        elif average < self.budget * self.upgrade_ratio and self.level > 0:
+            self.level -= 1
+            self.upgrades += 1
+        else:
+            return False
+
+        self.frames_since_change = 0
+        return True
+
+    def metrics(self) -> dict:
+        return {
+            "level": self.level,
+            "budget": self.budget,
+            "average_frame_time": self.average_frame_time,
+            "worst_frame_time": self.worst_frame_time,
+            "frames": self.frames,
+            "frames_over_budget": self.frames_over_budget,
+            "downgrades": self.downgrades,
+            "upgrades": self.upgrades,
+        }
+
+    def __repr__(self) -> str:
+        return f"QualityGovernor(level={self.level}, average_frame_time={self.average_frame_time:.2f})"
@@ -0,0 +1,62 @@
+from collections import namedtuple
+
+import pygame
+
+from utils.assets import assets
+
+# Immutable copies of what the renderer needs, built by the simulation thread.
+# `angle` is None for sprites drawn unrotated at their top-left corner, and
+# `hitbox` is the collision rect to overlay in debug mode, otherwise None.
+SpriteState = namedtuple(
+    "SpriteState",
+    ["sprite", "x", "y", "width", "height", "angle", "visible", "hitbox"],
+)
+RenderState = namedtuple(
+    "RenderState", ["tick", "score", "lives", "player", "bullets", "asteroids"]
+)
+
+
+class StateBuffer:
+    """Double buffer for RenderStates shared between two threads.
+
+    The simulation writes each state into the back slot and then flips it to
+    the front, so the renderer always reads a complete, immutable state.
+    """
+
+    def __init__(self) -> None:
+        self.slots: list[RenderState | None] = [None, None]
+        self.front = 0
+
+    def publish(self, state: RenderState) -> None:
+        back = 1 - self.front
+        self.slots[back] = state
+        self.front = back
+
+    def latest(self):
+        return self.slots[self.front]
+
+    def __repr__(self) -> str:
+        return f"StateBuffer(latest={self.latest()})"
+
+
+def draw_sprite(screen: pygame.Surface, state: SpriteState) -> None:
+    """Draw a sprite the same way the entities' own draw methods do."""
+    if state.hitbox is not None:
+        # Asteroids, the unrotated sprites, fill their debug rect
+        pygame.draw.rect(
+            screen, (255, 0, 0), state.hitbox, 0 if state.angle is None else 1
+        )
+
+    if not state.visible:
+        return
+
+    image = assets.scaled(state.sprite, (state.width, state.height))
+    if state.angle is None:
+        screen.blit(image, (state.x, state.y))
+        return
+
+    rotated_image = pygame.transform.rotate(image, state.angle)
+    rotated_rect = rotated_image.get_rect(
+        center=(state.x + state.width // 2, state.y + state.height // 2)
+    )
+    screen.blit(rotated_image, rotated_rect.topleft)
@@ -0,0 +1,66 @@
+import struct
+
+# Snapshot layout: header, then the player, asteroid and bullet sections, each
+# prefixed with its length. Bump SNAPSHOT_VERSION whenever a layout changes.
+SNAPSHOT_MAGIC = b"AZSN"
+SNAPSHOT_VERSION = 1
+
+# magic, version, score, spawn timer
+HEADER = struct.Struct("<4sHqi")
+SECTION = struct.Struct("<I")
+
+
+def pack_snapshot(score, spawn_timer, player, asteroids_manager, bullets_manager):
+    """Serialize a running game into a versioned binary snapshot."""
+    parts = [HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, score, spawn_timer)]
+    for section in (
+        player.snapshot(),
+        asteroids_manager.snapshot(),
+        bullets_manager.snapshot(),
+    ):
+        parts.append(SECTION.pack(len(section)))
+        parts.append(section)
+
+    return b"".join(parts)
+
+
+def unpack_snapshot(data, player, asteroids_manager, bullets_manager):
+    """Restore the entities from a snapshot and return `(score, spawn_timer)`.
+
+    The whole snapshot is parsed and validated before anything is changed, so a
+    malformed one raises ValueError and leaves the running game untouched.
+    """
+    data = memoryview(data)
+    if len(data) < HEADER.size:
+        raise ValueError("Data is too short to be a game snapshot.")
+
+    magic, version, score, spawn_timer = HEADER.unpack_from(data)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("Data is not a game snapshot.")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported snapshot version {version}.")
+
+    targets = (player, asteroids_manager, bullets_manager)
+    states = []
+    offset = HEADER.size
+    for target in targets:
+        if len(data) < offset + SECTION.size:
+            raise ValueError("Snapshot is truncated.")
+        (length,) = SECTION.unpack_from(data, offset)
+        offset += SECTION.size
+        if len(data) < offset + length:
+            raise ValueError("Snapshot is truncated.")
+
+        try:
+            states.append(target.parse_snapshot(data[offset : offset + length]))
+        except struct.error as e:
+            raise ValueError(f"Malformed snapshot section: {e}") from e
+        offset += length
+
+    if offset != len(data):
+        raise ValueError(f"Snapshot has {len(data) - offset} unexpected trailing bytes.")
+
+    for target, state in zip(targets, states):
+        target.apply_snapshot(state)
+
+    return score, spawn_timer
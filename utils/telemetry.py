@@ -0,0 +1,275 @@
+import json
+import logging
+import logging.handlers
+import os
+import threading
+import time
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+METRIC_PREFIX = "asteroidz_"
+PROMETHEUS_HOST = "127.0.0.1"
+PROMETHEUS_PORT = 9464
+
+# Frame time buckets in milliseconds, around the 60 and 30 fps budgets
+FRAME_TIME_BUCKETS = (2, 4, 8, 12, 16.7, 20, 25, 33.3, 50, 100)
+
+
+class Counter:
+    """Monotonic count. Increment `value` directly in hot loops."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0
+
+    def inc(self, amount: int = 1) -> None:
+        self.value += amount
+
+
+class Gauge:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0
+
+    def set(self, value) -> None:
+        self.value = value
+
+
+class Histogram:
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds) -> None:
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)  # last bucket is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class RingBuffer:
+    """Fixed-size buffer for one producer thread and one consumer thread.
+
+    The producer writes a slot and then advances `written`; the consumer only
+    reads slots below `written`, so no lock is needed. If the consumer falls
+    more than `capacity` items behind, the oldest items are skipped.
+    """
+
+    def __init__(self, capacity: int = 256) -> None:
+        self.slots = [None] * capacity
+        self.written = 0
+        self.read = 0
+
+    def push(self, item) -> None:
+        self.slots[self.written % len(self.slots)] = item
+        self.written += 1
+
+    def drain(self) -> list:
+        written = self.written
+        start = max(self.read, written - len(self.slots))
+        items = [self.slots[i % len(self.slots)] for i in range(start, written)]
+        self.read = written
+        return items
+
+    def latest(self):
+        written = self.written
+        if written == 0:
+            return None
+        return self.slots[(written - 1) % len(self.slots)]
+
+
+class Metrics:
+    """Registry of counters, gauges and histograms.
+
+    Recording only touches plain attributes. `sample` copies every metric into
+    a ring buffer, and an exporter thread started by `start` writes those
+    samples out as rotating JSONL files or serves the latest one as
+    Prometheus text.
+    """
+
+    def __init__(self) -> None:
+        self.counters: dict[str, Counter] = {}
+        self.gauges: dict[str, Gauge] = {}
+        self.histograms: dict[str, Histogram] = {}
+        self.samples = RingBuffer()
+        self.exporter = None
+
+    def counter(self, name: str) -> Counter:
+        return self.counters.setdefault(name, Counter())
+
+    def gauge(self, name: str) -> Gauge:
+        return self.gauges.setdefault(name, Gauge())
+
+    def histogram(self, name: str, bounds) -> Histogram:
+        return self.histograms.setdefault(name, Histogram(bounds))
+
+    @property
+    def started(self) -> bool:
+        return self.exporter is not None
+
+    def sample(self) -> None:
+        """Push a copy of every metric to the exporter."""
+        if not self.started:
+            return
+
+        self.samples.push(
+            {
+                "time": time.time(),
+                "counters": {
+                    name: counter.value for name, counter in self.counters.items()
+                },
+                "gauges": {name: gauge.value for name, gauge in self.gauges.items()},
+                "histograms": {
+                    name: {
+                        "bounds": histogram.bounds,
+                        "counts": list(histogram.counts),
+                        "sum": histogram.sum,
+                        "count": histogram.count,
+                    }
+                    for name, histogram in self.histograms.items()
+                },
+            }
+        )
+
+    def start(self, mode: str, directory: str = "telemetry") -> None:
+        """Start exporting samples, with `mode` either "jsonl" or "prometheus"."""
+        if self.started:
+            return
+
+        if mode == "jsonl":
+            self.exporter = JsonlExporter(self.samples, directory)
+        elif mode == "prometheus":
+            self.exporter = PrometheusExporter(self.samples)
+        else:
+            raise ValueError(f"Unknown telemetry mode '{mode}'.")
+
+    def close(self) -> None:
+        """Export a last sample and stop the exporter."""
+        if not self.started:
+            return
+
+        self.sample()
+        self.exporter.close()
+        self.exporter = None
+
+    def __repr__(self) -> str:
+        return f"Metrics(counters={len(self.counters)}, gauges={len(self.gauges)}, histograms={len(self.histograms)})"
+
+
+class JsonlExporter:
+    """Appends samples to `metrics.jsonl`, rotating it when it grows too large."""
+
+    def __init__(
+        self,
+        samples: RingBuffer,
+        directory: str,
+        interval: float = 5.0,
+        max_bytes: int = 10_000_000,
+        backups: int = 5,
+    ) -> None:
+        self.samples = samples
+        self.interval = interval
+        self.stopped = threading.Event()
+
+        os.makedirs(directory, exist_ok=True)
+        handler = logging.handlers.RotatingFileHandler(
+            os.path.join(directory, "metrics.jsonl"),
+            maxBytes=max_bytes,
+            backupCount=backups,
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        self.handler = handler
+        self.logger = logging.getLogger("asteroidz.telemetry")
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        self.logger.addHandler(handler)
+
+        self.thread = threading.Thread(
+            target=self.run, name="telemetry-jsonl", daemon=True
+        )
+        self.thread.start()
+
+    def run(self) -> None:
+        while not self.stopped.wait(self.interval):
+            self.flush()
+
+    def flush(self) -> None:
+        for sample in self.samples.drain():
+            self.logger.info(json.dumps(sample))
+
+    def close(self) -> None:
+        """Stop the thread and write out the samples it has not flushed yet."""
+        self.stopped.set()
+        self.thread.join()
+        self.flush()
+        self.logger.removeHandler(self.handler)
+        self.handler.close()
+
+
+class PrometheusExporter:
+    """Serves the latest sample in Prometheus text format on localhost."""
+
+    def __init__(
+        self, samples: RingBuffer, host: str = PROMETHEUS_HOST, port: int = PROMETHEUS_PORT
+    ) -> None:
+        self.samples = samples
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = exporter.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, name="telemetry-prometheus", daemon=True
+        )
+        self.thread.start()
+
+    def render(self) -> str:
+        sample = self.samples.latest()
+        if sample is None:
+            return ""
+
+        lines = []
+        for name, value in sample["counters"].items():
+            lines.append(f"# TYPE {METRIC_PREFIX}{name}_total counter")
+            lines.append(f"{METRIC_PREFIX}{name}_total {value}")
+
+        for name, value in sample["gauges"].items():
+            lines.append(f"# TYPE {METRIC_PREFIX}{name} gauge")
+            lines.append(f"{METRIC_PREFIX}{name} {value}")
+
+        for name, histogram in sample["histograms"].items():
+            metric = METRIC_PREFIX + name
+            lines.append(f"# TYPE {metric} histogram")
+            cumulative = 0
+            for bound, count in zip(
+                list(histogram["bounds"]) + ["+Inf"], histogram["counts"]
+            ):
+                cumulative += count
+                lines.append(f'{metric}_bucket{{le="{bound}"}} {cumulative}')
+            lines.append(f"{metric}_sum {histogram['sum']}")
+            lines.append(f"{metric}_count {histogram['count']}")
+
+        return "\n".join(lines) + "\n"
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+# Shared by the entities, the asset manager and the game
+metrics = Metrics()